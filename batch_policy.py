@@ -0,0 +1,68 @@
+"""
+Portfolio-level payment plan screening over many customers at once.
+"""
+
+
+from typing import List, Tuple
+
+import numpy as np
+from numba import njit, prange
+
+from financial_agent import (
+    HISTORY_POOR,
+    PLAN_MAX_AMOUNT,
+    PLAN_MAX_DAYS_LATE,
+    PLAN_MAX_RISK_SCORE,
+    CustomerProfile
+)
+
+
+@njit(parallel=True, cache=True)
+def batch_eligibility(
+    amounts: np.ndarray,
+    days: np.ndarray,
+    hist_codes: np.ndarray,
+    risks: np.ndarray,
+    max_amount: float,
+    max_days_late: int,
+    poor_code: int,
+    max_risk_score: float
+) -> np.ndarray:
+    """Payment plan failure bitmask per customer, same bit layout as _PLAN_REASONS"""
+    # Thresholds are arguments, not globals: numba bakes globals into the
+    # on-disk cache and would not notice changes made in financial_agent.py
+    n = amounts.shape[0]
+    out = np.zeros(n, np.uint8)
+    for i in prange(n):
+        mask = 0
+        if amounts[i] > max_amount:
+            mask |= 1
+        if days[i] > max_days_late:
+            mask |= 2
+        if hist_codes[i] == poor_code:
+            mask |= 4
+        if risks[i] > max_risk_score:
+            mask |= 8
+        out[i] = mask
+    return out
+
+
+def customer_arrays(customers: List[CustomerProfile]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Split customer profiles into per-field arrays for batch_eligibility"""
+    n = len(customers)
+    amounts = np.fromiter((c.amount_due for c in customers), dtype=np.float64, count=n)
+    days = np.fromiter((c.days_late for c in customers), dtype=np.int64, count=n)
+    hist_codes = np.fromiter((c._history_code for c in customers), dtype=np.int8, count=n)
+    risks = np.fromiter((c.risk_score for c in customers), dtype=np.float64, count=n)
+    return amounts, days, hist_codes, risks
+
+
+def screen_customers(customers: List[CustomerProfile]) -> np.ndarray:
+    """Payment plan failure bitmask for every customer; 0 means eligible"""
+    return batch_eligibility(
+        *customer_arrays(customers),
+        PLAN_MAX_AMOUNT,
+        PLAN_MAX_DAYS_LATE,
+        HISTORY_POOR,
+        PLAN_MAX_RISK_SCORE
+    )
@@ -1,15 +1,30 @@
-import json
 import os
+import re
+import time
+import orjson
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
 from openai import OpenAI
 from dotenv import load_dotenv
 load_dotenv()
 api_key=os.getenv("OPENROUTER_API_KEY")
 
 
-@dataclass
+PAYMENT_HISTORY_CODES = {'poor': 0, 'average': 1, 'good': 2}
+HISTORY_POOR = PAYMENT_HISTORY_CODES['poor']
+HISTORY_GOOD = PAYMENT_HISTORY_CODES['good']
+
+PLAN_MAX_AMOUNT = 1000
+PLAN_MAX_DAYS_LATE = 30
+PLAN_MAX_RISK_SCORE = 0.65
+
+SETTLEMENT_MAX_DAYS_LATE = 15
+SETTLEMENT_MAX_RISK_SCORE = 0.30
+
+
+@dataclass(frozen=True, slots=True)
 class CustomerProfile:
     id: str
     name: str
@@ -19,55 +34,110 @@ class CustomerProfile:
     risk_score: float
     consent_to_store_transcript: bool
     transcript_retention_days: int
+    _history_code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_history_code", PAYMENT_HISTORY_CODES[self.payment_history])
+
+
+_PLAN_REASONS = (
+    "balance exceeds €1,000 (current: €{amount_due:.2f})",
+    "payment is overdue by more than 30 days (current: {days_late} days)",
+    "payment history is classified as poor",
+    "risk score is too high (current: {risk_score:.2f})"
+)
+
+_SETTLEMENT_REASONS = (
+    "payment is overdue by more than 15 days (current: {days_late} days)",
+    "payment history must be 'good'",
+    "risk score exceeds 0.30 (current: {risk_score:.2f})"
+)
+
+
+def _join_reasons(templates: Tuple[str, ...], mask: int, **values) -> str:
+    return " and ".join(
+        template.format(**values) for i, template in enumerate(templates) if mask >> i & 1
+    )
+
+
+@lru_cache(maxsize=1024)
+def _payment_plan_eligibility(amount_due: float, days_late: int, history_code: int, risk_score: float) -> Tuple[bool, str]:
+    mask = (
+        (amount_due > PLAN_MAX_AMOUNT)
+        | (days_late > PLAN_MAX_DAYS_LATE) << 1
+        | (history_code == HISTORY_POOR) << 2
+        | (risk_score > PLAN_MAX_RISK_SCORE) << 3
+    )
+    
+    if mask:
+        return False, _join_reasons(
+            _PLAN_REASONS, mask, amount_due=amount_due, days_late=days_late, risk_score=risk_score
+        )
+    
+    return True, "all eligibility criteria are met"
+
+
+@lru_cache(maxsize=1024)
+def _settlement_discount_eligibility(days_late: int, history_code: int, risk_score: float) -> Tuple[bool, str]:
+    mask = (
+        (days_late > SETTLEMENT_MAX_DAYS_LATE)
+        | (history_code != HISTORY_GOOD) << 1
+        | (risk_score > SETTLEMENT_MAX_RISK_SCORE) << 2
+    )
+    
+    if mask:
+        return False, _join_reasons(
+            _SETTLEMENT_REASONS, mask, days_late=days_late, risk_score=risk_score
+        )
+    
+    return True, "all criteria for settlement discount are met"
 
 
 class PolicyEngine:
+    @staticmethod
+    def _eligible_plan(customer: CustomerProfile) -> bool:
+        # Most frequently failing conditions first
+        if customer._history_code == HISTORY_POOR:
+            return False
+        if customer.risk_score > PLAN_MAX_RISK_SCORE:
+            return False
+        if customer.days_late > PLAN_MAX_DAYS_LATE:
+            return False
+        if customer.amount_due > PLAN_MAX_AMOUNT:
+            return False
+        return True
+    
+    @staticmethod
+    def _eligible_settlement(customer: CustomerProfile) -> bool:
+        # Most frequently failing conditions first
+        if customer._history_code != HISTORY_GOOD:
+            return False
+        if customer.risk_score > SETTLEMENT_MAX_RISK_SCORE:
+            return False
+        if customer.days_late > SETTLEMENT_MAX_DAYS_LATE:
+            return False
+        return True
+    
     @staticmethod
     def check_payment_plan_eligibility(customer: CustomerProfile) -> Tuple[bool, str]:
-        reasons = []
-        
-        if customer.amount_due > 1000:
-            reasons.append(f"balance exceeds €1,000 (current: €{customer.amount_due:.2f})")
-        
-        if customer.days_late > 30:
-            reasons.append(f"payment is overdue by more than 30 days (current: {customer.days_late} days)")
-        
-        if customer.payment_history == 'poor':
-            reasons.append("payment history is classified as poor")
-        
-        if customer.risk_score > 0.65:
-            reasons.append(f"risk score is too high (current: {customer.risk_score:.2f})")
-        
-        if reasons:
-            return False, " and ".join(reasons)
-        
-        return True, "all eligibility criteria are met"
+        return _payment_plan_eligibility(
+            customer.amount_due, customer.days_late, customer._history_code, customer.risk_score
+        )
     
     @staticmethod
     def check_immediate_settlement_discount(customer: CustomerProfile) -> Tuple[bool, str]:
-        reasons = []
-        
-        if customer.days_late > 15:
-            reasons.append(f"payment is overdue by more than 15 days (current: {customer.days_late} days)")
-        
-        if customer.payment_history != 'good':
-            reasons.append("payment history must be 'good'")
-        
-        if customer.risk_score > 0.30:
-            reasons.append(f"risk score exceeds 0.30 (current: {customer.risk_score:.2f})")
-        
-        if reasons:
-            return False, " and ".join(reasons)
-        
-        return True, "all criteria for settlement discount are met"
+        return _settlement_discount_eligibility(
+            customer.days_late, customer._history_code, customer.risk_score
+        )
     
     @staticmethod
     def calculate_payment_plan_terms(customer: CustomerProfile) -> Optional[Dict]:
-        eligible, _ = PolicyEngine.check_payment_plan_eligibility(customer)
-        
-        if not eligible:
+        if not PolicyEngine._eligible_plan(customer):
             return None
-
+        return PolicyEngine._plan_terms(customer)
+    
+    @staticmethod
+    def _plan_terms(customer: CustomerProfile) -> Dict:
         if customer.amount_due <= 300:
             installments = 3
         elif customer.amount_due <= 600:
@@ -85,11 +155,12 @@ class PolicyEngine:
     
     @staticmethod
     def calculate_settlement_discount(customer: CustomerProfile) -> Optional[Dict]:
-        eligible, _ = PolicyEngine.check_immediate_settlement_discount(customer)
-        
-        if not eligible:
+        if not PolicyEngine._eligible_settlement(customer):
             return None
-        
+        return PolicyEngine._settlement_terms(customer)
+    
+    @staticmethod
+    def _settlement_terms(customer: CustomerProfile) -> Dict:
         discount_rate = 0.05
         discount_amount = customer.amount_due * discount_rate
         final_amount = customer.amount_due - discount_amount
@@ -103,20 +174,35 @@ class PolicyEngine:
 
 
 class ToolRegistry:
+    _TOOL_NAMES = frozenset({
+        "check_payment_plan_eligibility",
+        "get_payment_plan_options",
+        "check_settlement_discount_eligibility",
+        "get_settlement_discount_details",
+        "escalate_to_human",
+        "log_customer_question"
+    })
+    _zero_arg = frozenset({
+        "check_payment_plan_eligibility",
+        "get_payment_plan_options",
+        "check_settlement_discount_eligibility",
+        "get_settlement_discount_details"
+    })
+
     def __init__(self, customer: CustomerProfile, policy_engine: PolicyEngine):
         self.customer = customer
         self.policy = policy_engine
-        self.tools = {
-            "check_payment_plan_eligibility": self.check_payment_plan_eligibility,
-            "get_payment_plan_options": self.get_payment_plan_options,
-            "check_settlement_discount_eligibility": self.check_settlement_discount_eligibility,
-            "get_settlement_discount_details": self.get_settlement_discount_details,
-            "escalate_to_human": self.escalate_to_human,
-            "log_customer_question": self.log_customer_question
+        plan_elig = policy_engine.check_payment_plan_eligibility(customer)
+        discount_elig = policy_engine.check_immediate_settlement_discount(customer)
+        self._policy_cache = {
+            "plan_elig": plan_elig,
+            "plan_terms": policy_engine._plan_terms(customer) if plan_elig[0] else None,
+            "discount_elig": discount_elig,
+            "discount_details": policy_engine._settlement_terms(customer) if discount_elig[0] else None
         }
     
     def check_payment_plan_eligibility(self) -> Dict:
-        eligible, reason = self.policy.check_payment_plan_eligibility(self.customer)
+        eligible, reason = self._policy_cache["plan_elig"]
         return {
             "eligible": eligible,
             "reason": reason,
@@ -124,9 +210,9 @@ class ToolRegistry:
         }
     
     def get_payment_plan_options(self) -> Dict:
-        terms = self.policy.calculate_payment_plan_terms(self.customer)
+        terms = self._policy_cache["plan_terms"]
         if terms is None:
-            eligible, reason = self.policy.check_payment_plan_eligibility(self.customer)
+            _, reason = self._policy_cache["plan_elig"]
             return {
                 "available": False,
                 "reason": f"Not eligible because {reason}"
@@ -138,7 +224,7 @@ class ToolRegistry:
         }
     
     def check_settlement_discount_eligibility(self) -> Dict:
-        eligible, reason = self.policy.check_immediate_settlement_discount(self.customer)
+        eligible, reason = self._policy_cache["discount_elig"]
         return {
             "eligible": eligible,
             "reason": reason,
@@ -146,9 +232,9 @@ class ToolRegistry:
         }
     
     def get_settlement_discount_details(self) -> Dict:
-        discount = self.policy.calculate_settlement_discount(self.customer)
+        discount = self._policy_cache["discount_details"]
         if discount is None:
-            eligible, reason = self.policy.check_immediate_settlement_discount(self.customer)
+            _, reason = self._policy_cache["discount_elig"]
             return {
                 "available": False,
                 "reason": f"Not eligible because {reason}"
@@ -179,11 +265,13 @@ class ConversationLogger:
     def __init__(self, customer: CustomerProfile):
         self.customer = customer
         self.log = []
+        if customer.consent_to_store_transcript:
+            os.makedirs("logs", exist_ok=True)
     
     def add_message(self, role: str, content: str):
         if self.customer.consent_to_store_transcript:
             self.log.append({
-                "timestamp": datetime.now().isoformat(),
+                "ts_ns": time.time_ns(),
                 "role": role,
                 "content": content
             })
@@ -198,43 +286,138 @@ class ConversationLogger:
             "customer_name": self.customer.name,
             "conversation_date": datetime.now().isoformat(),
             "retention_days": self.customer.transcript_retention_days,
-            "messages": self.log
+            "messages": [
+                {
+                    "timestamp": datetime.fromtimestamp(msg["ts_ns"] / 1e9).isoformat(),
+                    "role": msg["role"],
+                    "content": msg["content"]
+                } for msg in self.log
+            ]
         }
         
-        os.makedirs("logs", exist_ok=True)
         filepath = os.path.join("logs", filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(log_data, option=orjson.OPT_INDENT_2))
         
         print(f"✅ Conversation saved to {filepath}")
 
 
-class FinancialAgent:
-    def __init__(self, customer: CustomerProfile, api_key: str):
-        self.customer = customer
-        self.policy = PolicyEngine()
-        self.tools = ToolRegistry(customer, self.policy)
-        self.logger = ConversationLogger(customer)
-        self.api_key = api_key
-        self.conversation_history = []
-
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-        )
-        self.system_prompt = self._build_system_prompt()
+def _auto_escalate(customer: CustomerProfile) -> Optional[str]:
+    # Only hand off when no policy offer is available at all
+    if PolicyEngine._eligible_plan(customer) or PolicyEngine._eligible_settlement(customer):
+        return None
     
-    def _build_system_prompt(self) -> str:
-        return f"""You are a professional financial collection agent working for a bank. Your role is to have a respectful, empathetic conversation with customers about their overdue payments.
+    if customer.amount_due > 2000:
+        reason = f"your balance of €{customer.amount_due:.2f} exceeds €2,000"
+    elif customer.risk_score > 0.80:
+        reason = f"your account's risk score of {customer.risk_score:.2f} exceeds 0.80"
+    elif customer._history_code == HISTORY_POOR and customer.amount_due > 1500:
+        reason = "your payment history is classified as poor and your balance exceeds €1,500"
+    else:
+        return None
+    
+    return (
+        f"Hello {customer.name}, I'm reaching out about the outstanding balance of "
+        f"€{customer.amount_due:.2f} on your account, which is {customer.days_late} days overdue. "
+        f"Because {reason}, I'm not able to offer a payment plan or settlement discount myself. "
+        "I'm transferring you to a specialist colleague who can review your situation and "
+        "discuss the options available to you."
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> OpenAI:
+    return OpenAI(
+        base_url="https://openrouter.ai/api/v1",
+        api_key=api_key,
+    )
+
+
+_HISTORY_WINDOW = 20
+
+_ESCALATE_RE = re.compile(r"escalate|transfer", re.IGNORECASE)
+
+
+_TOOLS_SCHEMA = [
+    {
+        "type": "function",
+        "function": {
+            "name": "check_payment_plan_eligibility",
+            "description": "Check if the customer is eligible for a payment plan based on their profile",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_payment_plan_options",
+            "description": "Get detailed payment plan terms and options for eligible customers",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "check_settlement_discount_eligibility",
+            "description": "Check if customer qualifies for immediate settlement discount",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_settlement_discount_details",
+            "description": "Get settlement discount amount and final payment details",
+            "parameters": {
+                "type": "object",
+                "properties": {},
+                "required": []
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "escalate_to_human",
+            "description": "Escalate the conversation to a human agent when unable to help",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reason": {
+                        "type": "string",
+                        "description": "The reason for escalation"
+                    }
+                },
+                "required": ["reason"]
+            }
+        }
+    }
+]
+
+
+class FinancialAgent:
+    _PROMPT_TEMPLATE = """You are a professional financial collection agent working for a bank. Your role is to have a respectful, empathetic conversation with customers about their overdue payments.
 
 CUSTOMER PROFILE:
-- Name: {self.customer.name}
-- Customer ID: {self.customer.id}
-- Outstanding Balance: €{self.customer.amount_due:.2f}
-- Days Overdue: {self.customer.days_late} days
-- Payment History: {self.customer.payment_history}
-- Risk Score: {self.customer.risk_score}
+- Name: {name}
+- Customer ID: {id}
+- Outstanding Balance: €{amount_due:.2f}
+- Days Overdue: {days_late} days
+- Payment History: {payment_history}
+- Risk Score: {risk_score}
 
 CRITICAL RULES (GUARDRAILS):
 1. NEVER invent payment options or terms - only use information from tools
@@ -259,91 +442,60 @@ YOUR APPROACH:
 2. PLAN: Determine which tools to use to help them
 3. ACT: Use tools to get accurate information, then respond with facts
 
-Begin the conversation by greeting {self.customer.name} and mentioning their outstanding balance of €{self.customer.amount_due:.2f}. Offer to help them find a repayment solution."""
+Begin the conversation by greeting {name} and mentioning their outstanding balance of €{amount_due:.2f}. Offer to help them find a repayment solution."""
+
+    def __init__(self, customer: CustomerProfile, api_key: str):
+        self.customer = customer
+        self.policy = PolicyEngine()
+        self.tools = ToolRegistry(customer, self.policy)
+        self.logger = ConversationLogger(customer)
+        self.api_key = api_key
+        self.conversation_history = []
+        self.escalated = False
+
+        self.client = _get_client(api_key)
+        self.system_prompt = self._build_system_prompt()
+        self._system_msg = {"role": "system", "content": self.system_prompt}
+    
+    def _build_system_prompt(self) -> str:
+        return self._PROMPT_TEMPLATE.format_map({
+            "name": self.customer.name,
+            "id": self.customer.id,
+            "amount_due": self.customer.amount_due,
+            "days_late": self.customer.days_late,
+            "payment_history": self.customer.payment_history,
+            "risk_score": self.customer.risk_score
+        })
     
     def _get_available_tools_schema(self) -> List[Dict]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "check_payment_plan_eligibility",
-                    "description": "Check if the customer is eligible for a payment plan based on their profile",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_payment_plan_options",
-                    "description": "Get detailed payment plan terms and options for eligible customers",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "check_settlement_discount_eligibility",
-                    "description": "Check if customer qualifies for immediate settlement discount",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_settlement_discount_details",
-                    "description": "Get settlement discount amount and final payment details",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
+        return _TOOLS_SCHEMA
+    
+    def _recent_history(self) -> List[Dict]:
+        history = self.conversation_history
+        start = max(0, len(history) - _HISTORY_WINDOW)
+        # Tool results must follow the assistant message that requested them
+        while start < len(history) and history[start]["role"] == "tool":
+            start += 1
+        return history[start:]
+    
+    def _build_call_params(self, messages: List[Dict], use_tools: bool) -> Dict:
+        call_params = {
+            "extra_headers": {
+                "X-Title": "Financial AI Agent",
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "escalate_to_human",
-                    "description": "Escalate the conversation to a human agent when unable to help",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "reason": {
-                                "type": "string",
-                                "description": "The reason for escalation"
-                            }
-                        },
-                        "required": ["reason"]
-                    }
-                }
-            }
-        ]
+            "model": "openai/gpt-4o",
+            "messages": messages
+        }
+
+        if use_tools:
+            call_params["tools"] = self._get_available_tools_schema()
+            call_params["tool_choice"] = "auto"
+        
+        return call_params
     
     def _call_llm(self, messages: List[Dict], use_tools: bool = True) -> Tuple[str, Optional[List]]:
         try:
-            call_params = {
-                "extra_headers": {
-                    "X-Title": "Financial AI Agent",
-                },
-                "model": "openai/gpt-4o",
-                "messages": messages
-            }
-
-            if use_tools:
-                call_params["tools"] = self._get_available_tools_schema()
-                call_params["tool_choice"] = "auto"
-            
+            call_params = self._build_call_params(messages, use_tools)
             completion = self.client.chat.completions.create(**call_params)
             
             message = completion.choices[0].message
@@ -355,7 +507,19 @@ Begin the conversation by greeting {self.customer.name} and mentioning their out
         except Exception as e:
             return f"Error calling LLM: {str(e)}", None
     
-    def sense_plan_act(self, user_input: Optional[str] = None) -> str:
+    def _stream_llm(self, messages: List[Dict]) -> Iterator[str]:
+        try:
+            call_params = self._build_call_params(messages, use_tools=False)
+            completion = self.client.chat.completions.create(stream=True, **call_params)
+            
+            for chunk in completion:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            
+        except Exception as e:
+            yield f"Error calling LLM: {str(e)}"
+    
+    def sense_plan_act_stream(self, user_input: Optional[str] = None) -> Iterator[str]:
         if user_input:
             self.conversation_history.append({
                 "role": "user",
@@ -363,15 +527,12 @@ Begin the conversation by greeting {self.customer.name} and mentioning their out
             })
             self.logger.add_message("customer", user_input)
 
-        messages = [
-            {"role": "system", "content": self.system_prompt}
-        ] + self.conversation_history
+        messages = [self._system_msg, *self._recent_history()]
 
         agent_response, tool_calls = self._call_llm(messages, use_tools=True)
 
         if tool_calls:
-
-            self.conversation_history.append({
+            assistant_msg = {
                 "role": "assistant",
                 "content": agent_response,
                 "tool_calls": [
@@ -384,41 +545,63 @@ Begin the conversation by greeting {self.customer.name} and mentioning their out
                         }
                     } for tc in tool_calls
                 ]
-            })
+            }
+            self.conversation_history.append(assistant_msg)
+            messages.append(assistant_msg)
             
             for tool_call in tool_calls:
                 function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
+                if function_name in self.tools._zero_arg or not tool_call.function.arguments:
+                    function_args = {}
+                else:
+                    function_args = orjson.loads(tool_call.function.arguments)
                 
-                if function_name in self.tools.tools:
-                    tool_result = self.tools.tools[function_name](**function_args)
+                if function_name in ToolRegistry._TOOL_NAMES:
+                    tool_result = getattr(self.tools, function_name)(**function_args)
+                    if function_name == "escalate_to_human":
+                        self.escalated = True
 
-                    self.conversation_history.append({
+                    tool_msg = {
                         "role": "tool",
                         "tool_call_id": tool_call.id,
                         "name": function_name,
-                        "content": json.dumps(tool_result)
-                    })
-
-            messages = [
-                {"role": "system", "content": self.system_prompt}
-            ] + self.conversation_history
+                        "content": orjson.dumps(tool_result).decode()
+                    }
+                    self.conversation_history.append(tool_msg)
+                    messages.append(tool_msg)
             
-            agent_response, _ = self._call_llm(messages, use_tools=False)
+            chunks = []
+            for chunk in self._stream_llm(messages):
+                chunks.append(chunk)
+                yield chunk
+            agent_response = "".join(chunks)
+        elif agent_response:
+            yield agent_response
 
         self.conversation_history.append({
             "role": "assistant",
             "content": agent_response
         })
         self.logger.add_message("agent", agent_response)
-        
-        return agent_response
+    
+    def sense_plan_act(self, user_input: Optional[str] = None) -> str:
+        return "".join(self.sense_plan_act_stream(user_input))
     
     def start_conversation(self) -> str:
         print(f"\n{'='*60}")
         print(f"Starting conversation with {self.customer.name} ({self.customer.id})")
         print(f"{'='*60}\n")
 
+        escalation_message = _auto_escalate(self.customer)
+        if escalation_message:
+            self.escalated = True
+            self.conversation_history.append({
+                "role": "assistant",
+                "content": escalation_message
+            })
+            self.logger.add_message("agent", escalation_message)
+            return escalation_message
+
         initial_message = self.sense_plan_act()
         return initial_message
     
@@ -428,8 +611,8 @@ Begin the conversation by greeting {self.customer.name} and mentioning their out
 
 
 def load_customers(json_file: str = "customers.json") -> List[CustomerProfile]:
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    with open(json_file, 'rb') as f:
+        data = orjson.loads(f.read())
     
     customers = []
     for cust_data in data['customers']:
@@ -444,6 +627,12 @@ def run_conversation(customer: CustomerProfile, api_key: str, max_turns: int = 1
     agent_msg = agent.start_conversation()
     print(f"Agent: {agent_msg}\n")
 
+    if agent.escalated:
+        print("⚠️  Conversation escalated to human agent")
+        agent.save_conversation()
+        print(f"\n{'='*60}\n")
+        return False
+
     turn_count = 0
     while turn_count < max_turns:
         try:
@@ -464,10 +653,15 @@ def run_conversation(customer: CustomerProfile, api_key: str, max_turns: int = 1
             continue
         
         print()
-        agent_msg = agent.sense_plan_act(user_input)
-        print(f"Agent: {agent_msg}\n")
-
-        if "escalate" in agent_msg.lower() or "transfer" in agent_msg.lower():
+        print("Agent: ", end="", flush=True)
+        chunks = []
+        for chunk in agent.sense_plan_act_stream(user_input):
+            chunks.append(chunk)
+            print(chunk, end="", flush=True)
+        print("\n")
+        agent_msg = "".join(chunks)
+
+        if agent.escalated or _ESCALATE_RE.search(agent_msg):
             print("⚠️  Conversation escalated to human agent")
             break
         
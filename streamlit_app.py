@@ -6,6 +6,7 @@ https://financial-agent-test-project.streamlit.app/
 
 import streamlit as st
 import os
+from itertools import chain
 from financial_agent import (
     CustomerProfile, 
     FinancialAgent, 
@@ -29,6 +30,18 @@ if 'conversation_started' not in st.session_state:
     st.session_state.conversation_started = False
 if 'messages' not in st.session_state:
     st.session_state.messages = []
+if 'agent_msgs' not in st.session_state:
+    st.session_state.agent_msgs = 0
+if 'customer_msgs' not in st.session_state:
+    st.session_state.customer_msgs = 0
+if 'pending_input' not in st.session_state:
+    st.session_state.pending_input = None
+
+
+@st.cache_data
+def _cached_customers(path: str):
+    """Load customers from disk once per process"""
+    return load_customers(path)
 
 
 def initialize_agent(customer: CustomerProfile, api_key: str):
@@ -36,6 +49,9 @@ def initialize_agent(customer: CustomerProfile, api_key: str):
     st.session_state.agent = FinancialAgent(customer, api_key)
     st.session_state.conversation_started = False
     st.session_state.messages = []
+    st.session_state.agent_msgs = 0
+    st.session_state.customer_msgs = 0
+    st.session_state.pending_input = None
 
 
 def start_conversation():
@@ -47,25 +63,38 @@ def start_conversation():
                 "role": "agent",
                 "content": initial_message
             })
+            st.session_state.agent_msgs += 1
             st.session_state.conversation_started = True
 
 
 def send_message(user_input: str):
-    """Send a message and get response"""
+    """Queue a customer message; the reply is streamed into the chat on the next run"""
     if st.session_state.agent:
         # Add user message
         st.session_state.messages.append({
             "role": "customer",
             "content": user_input
         })
-        
-        # Get agent response
+        st.session_state.customer_msgs += 1
+        st.session_state.pending_input = user_input
+
+
+def stream_pending_response():
+    """Stream the agent's reply to the queued customer message"""
+    user_input = st.session_state.pending_input
+    st.session_state.pending_input = None
+    
+    chunks = st.session_state.agent.sense_plan_act_stream(user_input)
+    with st.chat_message("assistant", avatar="🤖"):
+        # Tool selection and dispatch run before the first chunk arrives
         with st.spinner("Agent is thinking..."):
-            response = st.session_state.agent.sense_plan_act(user_input)
-            st.session_state.messages.append({
-                "role": "agent",
-                "content": response
-            })
+            first_chunk = next(chunks, "")
+        response = st.write_stream(chain([first_chunk], chunks))
+    st.session_state.messages.append({
+        "role": "agent",
+        "content": response
+    })
+    st.session_state.agent_msgs += 1
 
 
 def display_customer_profile(customer: CustomerProfile):
@@ -96,7 +125,7 @@ def main():
         
         # Load customers
         try:
-            customers = load_customers("customers.json")
+            customers = _cached_customers("customers.json")
             st.success(f"✅ Loaded {len(customers)} customers")
         except FileNotFoundError:
             st.error("❌ customers.json not found!")
@@ -127,8 +156,8 @@ def main():
         # Reset conversation button
         if st.session_state.conversation_started:
             if st.button("🔄 Reset Conversation", use_container_width=True):
-                st.session_state.conversation_started = False
-                st.session_state.messages = []
+                # Fresh agent: clears its history and escalation state
+                initialize_agent(st.session_state.agent.customer, api_key)
                 st.rerun()
         
         # Policy info
@@ -214,6 +243,13 @@ def main():
             else:
                 with st.chat_message("user", avatar="👤"):
                     st.write(msg["content"])
+        
+        if st.session_state.pending_input:
+            stream_pending_response()
+    
+    escalated = st.session_state.agent.escalated
+    if escalated:
+        st.warning("⚠️ Conversation escalated to human agent")
     
     # Input area
     st.markdown("---")
@@ -223,22 +259,22 @@ def main():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if st.button("📋 Payment Plan Info", use_container_width=True):
+        if st.button("📋 Payment Plan Info", use_container_width=True, disabled=escalated):
             send_message("What payment plans are available for me?")
             st.rerun()
     
     with col2:
-        if st.button("💰 Settlement Discount", use_container_width=True):
+        if st.button("💰 Settlement Discount", use_container_width=True, disabled=escalated):
             send_message("Can I get a discount if I pay immediately?")
             st.rerun()
     
     with col3:
-        if st.button("❓ Ask Question", use_container_width=True):
+        if st.button("❓ Ask Question", use_container_width=True, disabled=escalated):
             send_message("I have some questions about my options.")
             st.rerun()
     
     with col4:
-        if st.button("✅ Interested", use_container_width=True):
+        if st.button("✅ Interested", use_container_width=True, disabled=escalated):
             send_message("Yes, I'm interested in hearing about payment options.")
             st.rerun()
     
@@ -252,11 +288,12 @@ def main():
             "Your message",
             key="user_input",
             placeholder="Type your message here...",
-            label_visibility="collapsed"
+            label_visibility="collapsed",
+            disabled=escalated
         )
     
     with col2:
-        send_btn = st.button("Send", use_container_width=True, type="primary")
+        send_btn = st.button("Send", use_container_width=True, type="primary", disabled=escalated)
     
     # Send message
     if send_btn and user_input:
@@ -282,16 +319,13 @@ def main():
     
     # Conversation stats
     if len(st.session_state.messages) > 0:
-        agent_msgs = len([m for m in st.session_state.messages if m["role"] == "agent"])
-        customer_msgs = len([m for m in st.session_state.messages if m["role"] == "customer"])
-        
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Total Messages", len(st.session_state.messages))
         with col2:
-            st.metric("Agent Messages", agent_msgs)
+            st.metric("Agent Messages", st.session_state.agent_msgs)
         with col3:
-            st.metric("Customer Messages", customer_msgs)
+            st.metric("Customer Messages", st.session_state.customer_msgs)
 
 
 if __name__ == "__main__":